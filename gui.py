@@ -1,10 +1,42 @@
 import pygame
-import numpy as np
+import math
 import sys
+from collections import deque
 from typing import Optional, Tuple
 from raymarcher import RayMarcher
 
 class RaymarchGUI:
+    # Resolution presets cycled with F12 (native resolution is appended)
+    RESOLUTION_PRESETS = (
+        (800, 600),    # SVGA
+        (1024, 768),   # XGA
+        (1280, 720),   # HD
+        (1366, 768),   # WXGA
+        (1920, 1080),  # Full HD
+        (2560, 1440),  # QHD
+    )
+    
+    # Controls help shown in the overlay while the mouse is free
+    HELP_TEXTS = (
+        "Controls:",
+        "WASD - Move camera",
+        "Mouse/Arrows - Look around",
+        "Space/Shift - Up/Down",
+        "F1 - Toggle FPS",
+        "F2 - Toggle camera info",
+        "F3 - Toggle mouse capture",
+        "F11 - Toggle fullscreen",
+        "F12 - Cycle resolution",
+        "R - Reset camera",
+        "ESC - Exit"
+    )
+    
+    # Overlay colors
+    OVERLAY_COLOR = (255, 255, 0)
+    HELP_TITLE_COLOR = (255, 255, 255)
+    HELP_COLOR = (200, 200, 200)
+    ERROR_COLOR = (255, 0, 0)
+    
     def __init__(self, width: int = 800, height: int = 600, title: str = "Raymarching Demo", 
                  fullscreen: bool = False, auto_resolution: bool = False):
         # Get display info first
@@ -13,6 +45,12 @@ class RaymarchGUI:
         self.screen_width = display_info.current_w
         self.screen_height = display_info.current_h
         
+        # Resolution cycle with a reverse lookup (first occurrence wins)
+        self._resolution_cycle = self.RESOLUTION_PRESETS + ((self.screen_width, self.screen_height),)
+        self._resolution_index = {}
+        for i, resolution in enumerate(self._resolution_cycle):
+            self._resolution_index.setdefault(resolution, i)
+        
         # Set initial resolution
         if auto_resolution or fullscreen:
             self.width = self.screen_width
@@ -36,6 +74,13 @@ class RaymarchGUI:
         pygame.display.set_caption(title)
         self.clock = pygame.time.Clock()
         
+        # Only queue the event types handle_events() acts on
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([
+            pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEMOTION,
+            pygame.MOUSEBUTTONDOWN, pygame.VIDEORESIZE, pygame.ACTIVEEVENT
+        ])
+        
         # Initialize raymarcher
         try:
             self.raymarcher = RayMarcher(self.width, self.height)
@@ -55,10 +100,15 @@ class RaymarchGUI:
         self.fps_font = pygame.font.Font(None, 36)
         self.show_fps = True
         self.show_camera_info = True
+        self._help_surfaces = None  # Static help text, rendered once
+        self._frame_surface = None  # Reused target for the raymarched image
+        self._text_cache = {}  # Overlay line -> ((text, color), rendered surface)
+        self._camera_labels_key = None  # Raw values behind the cached camera labels
+        self._camera_labels = ()
         
         # Performance tracking
-        self.frame_times = []
         self.max_frame_samples = 60
+        self.frame_times = deque(maxlen=self.max_frame_samples)
         
         # Running state
         self.running = True
@@ -68,9 +118,20 @@ class RaymarchGUI:
         if not fullscreen:
             self.windowed_size = (self.width, self.height)
         
-    def handle_events(self):
-        """Handle pygame events"""
-        for event in pygame.event.get():
+    def handle_events(self, events: Optional[list] = None):
+        """Handle pygame events (the queued ones unless a list is given)"""
+        if events is None:
+            events = pygame.event.get()
+        
+        # Mouse look works from last_mouse_pos, so only the latest motion event
+        # matters; it is kept at its original position in the queue
+        motions = [event for event in events if event.type == pygame.MOUSEMOTION]
+        if len(motions) > 1:
+            last_motion = motions[-1]
+            events = [event for event in events
+                      if event.type != pygame.MOUSEMOTION or event is last_motion]
+        
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
             
@@ -99,8 +160,7 @@ class RaymarchGUI:
                         self.running = False
                 elif event.key == pygame.K_r:
                     # Reset camera
-                    self.raymarcher.set_camera_position(0, 0, 5)
-                    self.raymarcher.set_camera_angles(0, 0, 0)
+                    self.raymarcher.reset_camera()
             
             elif event.type == pygame.KEYUP:
                 self.keys_pressed.discard(event.key)
@@ -141,30 +201,22 @@ class RaymarchGUI:
     
     def handle_continuous_input(self):
         """Handle continuous key input"""
-        # Camera movement
-        if pygame.K_w in self.keys_pressed:
-            self.raymarcher.move_camera('forward', self.move_speed)
-        if pygame.K_s in self.keys_pressed:
-            self.raymarcher.move_camera('backward', self.move_speed)
-        if pygame.K_a in self.keys_pressed:
-            self.raymarcher.move_camera('left', self.move_speed)
-        if pygame.K_d in self.keys_pressed:
-            self.raymarcher.move_camera('right', self.move_speed)
-        if pygame.K_SPACE in self.keys_pressed:
-            self.raymarcher.move_camera('up', self.move_speed)
-        if pygame.K_LSHIFT in self.keys_pressed:
-            self.raymarcher.move_camera('down', self.move_speed)
-        
-        # Arrow key rotation
+        keys = self.keys_pressed
+        
+        # Camera movement, combined into a single offset per frame
+        dx = (pygame.K_d in keys) - (pygame.K_a in keys)
+        dy = (pygame.K_SPACE in keys) - (pygame.K_LSHIFT in keys)
+        dz = (pygame.K_s in keys) - (pygame.K_w in keys)
+        if dx or dy or dz:
+            speed = self.move_speed
+            self.raymarcher.translate_camera(dx * speed, dy * speed, dz * speed)
+        
+        # Arrow key rotation, combined into a single update per frame
         rotation_speed = 0.02
-        if pygame.K_LEFT in self.keys_pressed:
-            self.raymarcher.rotate_camera(yaw=-rotation_speed)
-        if pygame.K_RIGHT in self.keys_pressed:
-            self.raymarcher.rotate_camera(yaw=rotation_speed)
-        if pygame.K_UP in self.keys_pressed:
-            self.raymarcher.rotate_camera(pitch=-rotation_speed)
-        if pygame.K_DOWN in self.keys_pressed:
-            self.raymarcher.rotate_camera(pitch=rotation_speed)
+        yaw = (pygame.K_RIGHT in keys) - (pygame.K_LEFT in keys)
+        pitch = (pygame.K_DOWN in keys) - (pygame.K_UP in keys)
+        if pitch or yaw:
+            self.raymarcher.rotate_camera(pitch=pitch * rotation_speed, yaw=yaw * rotation_speed)
     
     def toggle_fullscreen(self):
         """Toggle between fullscreen and windowed mode"""
@@ -197,24 +249,11 @@ class RaymarchGUI:
     
     def cycle_resolution(self):
         """Cycle through different resolution presets"""
-        # Define resolution presets
-        resolutions = [
-            (800, 600),    # SVGA
-            (1024, 768),   # XGA
-            (1280, 720),   # HD
-            (1366, 768),   # WXGA
-            (1920, 1080),  # Full HD
-            (2560, 1440),  # QHD
-            (self.screen_width, self.screen_height)  # Native
-        ]
+        resolutions = self._resolution_cycle
         
         # Find current resolution and switch to next
-        current = (self.width, self.height)
-        try:
-            current_idx = resolutions.index(current)
-            next_idx = (current_idx + 1) % len(resolutions)
-        except ValueError:
-            next_idx = 0
+        current_idx = self._resolution_index.get((self.width, self.height))
+        next_idx = 0 if current_idx is None else (current_idx + 1) % len(resolutions)
         
         new_resolution = resolutions[next_idx]
         
@@ -242,6 +281,14 @@ class RaymarchGUI:
         
         print(f"Resolution changed to: {width}x{height}")
     
+    def _get_frame_surface(self, width: int, height: int) -> pygame.Surface:
+        """Return the persistent frame surface, recreating it only on resize"""
+        surface = self._frame_surface
+        if surface is None or surface.get_size() != (width, height):
+            surface = pygame.Surface((width, height)).convert()
+            self._frame_surface = surface
+        return surface
+    
     def render_frame(self) -> float:
         """Render a single frame and return render time"""
         import time
@@ -253,99 +300,127 @@ class RaymarchGUI:
             
             # Convert to pygame surface
             # OpenCL output is RGBA, pygame expects RGB
-            rgb_array = image_array[:, :, :3]  # Remove alpha channel
-            surface = pygame.surfarray.make_surface(rgb_array.swapaxes(0, 1))
+            rgb_array = image_array[:, :, :3].swapaxes(0, 1)  # Remove alpha channel
             
-            # Blit to screen
-            self.screen.blit(surface, (0, 0))
+            if self.screen.get_size() == rgb_array.shape[:2]:
+                # Frame covers the whole window: write it straight into the display
+                pygame.surfarray.blit_array(self.screen, rgb_array)
+            else:
+                surface = self._get_frame_surface(rgb_array.shape[0], rgb_array.shape[1])
+                pygame.surfarray.blit_array(surface, rgb_array)
+                
+                # Blit to screen
+                self.screen.blit(surface, (0, 0))
             
         except Exception as e:
             # Fallback to black screen on error
             self.screen.fill((0, 0, 0))
-            error_text = self.fps_font.render(f"Render Error: {str(e)[:50]}...", True, (255, 0, 0))
+            error_text = self.fps_font.render(f"Render Error: {str(e)[:50]}...", True, self.ERROR_COLOR)
             self.screen.blit(error_text, (10, 10))
         
         render_time = time.time() - start_time
         return render_time
     
+    def _render_text(self, slot: str, text: str, color: Tuple[int, int, int] = OVERLAY_COLOR) -> pygame.Surface:
+        """Render an overlay line, reusing the previous surface if its text and color are unchanged"""
+        key = (text, color)
+        cached = self._text_cache.get(slot)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        surface = self.fps_font.render(text, True, color)
+        self._text_cache[slot] = (key, surface)
+        return surface
+    
+    def _get_help_surfaces(self) -> list:
+        """Return the rendered controls help lines, rendering them on first use"""
+        if self._help_surfaces is None:
+            self._help_surfaces = [
+                self.fps_font.render(text, True, self.HELP_TITLE_COLOR if i == 0 else self.HELP_COLOR)
+                for i, text in enumerate(self.HELP_TEXTS)
+            ]
+        return self._help_surfaces
+    
+    def _get_camera_labels(self) -> Tuple[str, str, str, str]:
+        """Return the camera/mode overlay labels, reformatting only on change"""
+        raymarcher = self.raymarcher
+        key = (*raymarcher.camera_pos.tolist(), *raymarcher.camera_angles[:2].tolist(),
+               self.is_fullscreen, self.width, self.height)
+        if key != self._camera_labels_key:
+            x, y, z, pitch, yaw = key[:5]
+            mode_text = "Fullscreen" if self.is_fullscreen else "Windowed"
+            self._camera_labels = (
+                f"Pos: ({x:.2f}, {y:.2f}, {z:.2f})",
+                f"Angles: ({math.degrees(pitch):.1f}°, {math.degrees(yaw):.1f}°)",
+                f"Mode: {mode_text} ({self.width}x{self.height})",
+                f"Native: {self.screen_width}x{self.screen_height}",
+            )
+            self._camera_labels_key = key
+        return self._camera_labels
+    
     def draw_overlay(self, render_time: float):
         """Draw FPS and camera info overlay"""
+        # All overlay text is collected and drawn in a single blits() call
+        blit_list = []
         y_offset = 10
         
         if self.show_fps:
             # Calculate FPS
-            self.frame_times.append(render_time)
-            if len(self.frame_times) > self.max_frame_samples:
-                self.frame_times.pop(0)
+            self.frame_times.append(render_time)  # Oldest sample drops off automatically
             
             avg_time = sum(self.frame_times) / len(self.frame_times)
             fps = 1.0 / avg_time if avg_time > 0 else 0
             
             # Draw FPS
-            fps_text = self.fps_font.render(f"FPS: {fps:.1f} ({avg_time*1000:.1f}ms)", True, (255, 255, 0))
-            self.screen.blit(fps_text, (10, y_offset))
+            fps_text = self._render_text('fps', f"FPS: {fps:.1f} ({avg_time*1000:.1f}ms)")
+            blit_list.append((fps_text, (10, y_offset)))
             y_offset += 30
         
         if self.show_camera_info:
-            camera_info = self.raymarcher.get_camera_info()
-            pos = camera_info['position']
-            angles = camera_info['angles']
+            pos_label, angles_label, mode_label, native_label = self._get_camera_labels()
             
-            pos_text = self.fps_font.render(f"Pos: ({pos[0]:.2f}, {pos[1]:.2f}, {pos[2]:.2f})", True, (255, 255, 0))
-            self.screen.blit(pos_text, (10, y_offset))
+            pos_text = self._render_text('pos', pos_label)
+            blit_list.append((pos_text, (10, y_offset)))
             y_offset += 25
             
-            angles_text = self.fps_font.render(f"Angles: ({np.degrees(angles[0]):.1f}°, {np.degrees(angles[1]):.1f}°)", True, (255, 255, 0))
-            self.screen.blit(angles_text, (10, y_offset))
+            angles_text = self._render_text('angles', angles_label)
+            blit_list.append((angles_text, (10, y_offset)))
             y_offset += 25
             
             # Display mode info
-            mode_text = "Fullscreen" if self.is_fullscreen else "Windowed"
-            mode_surface = self.fps_font.render(f"Mode: {mode_text} ({self.width}x{self.height})", True, (255, 255, 0))
-            self.screen.blit(mode_surface, (10, y_offset))
+            mode_surface = self._render_text('mode', mode_label)
+            blit_list.append((mode_surface, (10, y_offset)))
             y_offset += 25
             
             # Display native resolution
-            native_surface = self.fps_font.render(f"Native: {self.screen_width}x{self.screen_height}", True, (255, 255, 0))
-            self.screen.blit(native_surface, (10, y_offset))
+            native_surface = self._render_text('native', native_label)
+            blit_list.append((native_surface, (10, y_offset)))
             y_offset += 25
         
         # Controls help
         if not self.mouse_captured:
-            help_texts = [
-                "Controls:",
-                "WASD - Move camera",
-                "Mouse/Arrows - Look around",
-                "Space/Shift - Up/Down",
-                "F1 - Toggle FPS",
-                "F2 - Toggle camera info",
-                "F3 - Toggle mouse capture",
-                "F11 - Toggle fullscreen",
-                "F12 - Cycle resolution",
-                "R - Reset camera",
-                "ESC - Exit"
-            ]
-            
-            for i, text in enumerate(help_texts):
-                color = (255, 255, 255) if i == 0 else (200, 200, 200)
-                help_surface = self.fps_font.render(text, True, color)
-                self.screen.blit(help_surface, (self.width - 250, 10 + i * 25))
+            for i, help_surface in enumerate(self._get_help_surfaces()):
+                blit_list.append((help_surface, (self.width - 250, 10 + i * 25)))
+        
+        self.screen.blits(blit_list, doreturn=False)
     
     def run(self):
         """Main game loop"""
-        print("Starting Raymarching Demo...")
-        print("Controls:")
-        print("  WASD - Move camera")
-        print("  Mouse/Arrow keys - Look around")
-        print("  F1 - Toggle FPS display")
-        print("  F2 - Toggle camera info")
-        print("  F3 - Toggle mouse capture")
-        print("  F11 - Toggle fullscreen")
-        print("  F12 - Cycle resolution")
-        print("  R - Reset camera")
-        print("  ESC - Exit")
-        print(f"Current resolution: {self.width}x{self.height}")
-        print(f"Native resolution: {self.screen_width}x{self.screen_height}")
+        sys.stdout.write(
+            "Starting Raymarching Demo...\n"
+            "Controls:\n"
+            "  WASD - Move camera\n"
+            "  Mouse/Arrow keys - Look around\n"
+            "  F1 - Toggle FPS display\n"
+            "  F2 - Toggle camera info\n"
+            "  F3 - Toggle mouse capture\n"
+            "  F11 - Toggle fullscreen\n"
+            "  F12 - Cycle resolution\n"
+            "  R - Reset camera\n"
+            "  ESC - Exit\n"
+            f"Current resolution: {self.width}x{self.height}\n"
+            f"Native resolution: {self.screen_width}x{self.screen_height}\n"
+        )
         
         while self.running:
             try:
@@ -353,6 +428,13 @@ class RaymarchGUI:
                 self.handle_events()
                 self.handle_continuous_input()
                 
+                # Nothing is visible while minimized or zero-sized; skip the GPU work
+                # and sleep until the next event (restore, resize, quit) arrives
+                if not pygame.display.get_active() or not (self.width and self.height):
+                    self.keys_pressed.clear()  # Key releases are not delivered while hidden
+                    self.handle_events([pygame.event.wait()])
+                    continue
+                
                 # Render frame
                 render_time = self.render_frame()
                 
@@ -4,29 +4,57 @@ Quick launch scripts for Raymarching Demo
 """
 
 import os
+import subprocess
 import sys
 
+# Launch presets: command -> main.py arguments
+LAUNCH_PRESETS = {
+    'fullscreen': ['--fullscreen', '--auto-resolution'],
+    'hd': ['--resolution', '1920x1080'],
+    '4k': ['--resolution', '3840x2160'],
+}
+
+# Alternative command names
+COMMAND_ALIASES = {
+    'fs': 'fullscreen',
+}
+
+# Commands that show the option list
+HELP_COMMANDS = frozenset({'help', '-h', '--help'})
+
+def launch(args):
+    """Replace the launcher process with main.py and the given arguments"""
+    main_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'main.py')
+    argv = [sys.executable, main_path, *args]
+    
+    if os.name == 'nt':
+        # Windows has no true exec; os.execv would return control to the shell early
+        sys.exit(subprocess.call(argv))
+    os.execv(sys.executable, argv)
+
 def launch_fullscreen():
     """Launch in fullscreen mode with native resolution"""
-    os.system('python main.py --fullscreen --auto-resolution')
+    launch(LAUNCH_PRESETS['fullscreen'])
 
 def launch_hd():
     """Launch in 1920x1080 resolution"""
-    os.system('python main.py --resolution 1920x1080')
+    launch(LAUNCH_PRESETS['hd'])
 
 def launch_4k():
     """Launch in 4K resolution if supported"""
-    os.system('python main.py --resolution 3840x2160')
+    launch(LAUNCH_PRESETS['4k'])
 
 def show_help():
     """Show available launch options"""
-    print("Raymarching Demo - Launch Options:")
-    print("1. Fullscreen (native resolution): python launcher.py fullscreen")
-    print("2. HD (1920x1080): python launcher.py hd") 
-    print("3. 4K (3840x2160): python launcher.py 4k")
-    print("4. Custom: python main.py --resolution WIDTHxHEIGHT")
-    print("5. Windowed: python main.py --width WIDTH --height HEIGHT")
-    print("6. Help: python main.py --help")
+    sys.stdout.write(
+        "Raymarching Demo - Launch Options:\n"
+        "1. Fullscreen (native resolution): python launcher.py fullscreen\n"
+        "2. HD (1920x1080): python launcher.py hd\n"
+        "3. 4K (3840x2160): python launcher.py 4k\n"
+        "4. Custom: python main.py --resolution WIDTHxHEIGHT\n"
+        "5. Windowed: python main.py --width WIDTH --height HEIGHT\n"
+        "6. Help: python main.py --help\n"
+    )
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
@@ -34,14 +62,11 @@ if __name__ == "__main__":
         sys.exit(0)
     
     command = sys.argv[1].lower()
+    command = COMMAND_ALIASES.get(command, command)
     
-    if command == "fullscreen" or command == "fs":
-        launch_fullscreen()
-    elif command == "hd":
-        launch_hd()
-    elif command == "4k":
-        launch_4k()
-    elif command == "help" or command == "-h":
+    if command in LAUNCH_PRESETS:
+        launch(LAUNCH_PRESETS[command])
+    elif command in HELP_COMMANDS:
         show_help()
     else:
         print(f"Unknown command: {command}")
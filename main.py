@@ -12,30 +12,23 @@ Date: 2025
 import sys
 import os
 import argparse
+import importlib.util
+from functools import lru_cache
+
+# Import name -> pip package name
+REQUIRED_MODULES = (
+    ("pyopencl", "pyopencl"),
+    ("numpy", "numpy"),
+    ("pygame", "pygame"),
+)
 
 def check_dependencies():
     """Check if all required dependencies are installed"""
-    missing_deps = []
-    
-    try:
-        import pyopencl
-    except ImportError:
-        missing_deps.append("pyopencl")
-    
-    try:
-        import numpy
-    except ImportError:
-        missing_deps.append("numpy")
-    
-    try:
-        import pygame
-    except ImportError:
-        missing_deps.append("pygame")
-    
-    try:
-        import PIL
-    except ImportError:
-        missing_deps.append("Pillow")
+    # find_spec locates the packages without importing them
+    missing_deps = [
+        package for module, package in REQUIRED_MODULES
+        if importlib.util.find_spec(module) is None
+    ]
     
     if missing_deps:
         print("Missing required dependencies:")
@@ -69,15 +62,20 @@ def check_opencl():
         print(f"OpenCL check failed: {e}")
         return False
 
-def parse_arguments():
-    """Parse command line arguments"""
+@lru_cache(maxsize=1)
+def create_parser() -> argparse.ArgumentParser:
+    """Create the command line parser (built once and reused)"""
     parser = argparse.ArgumentParser(description='Raymarching/Raytracing Demo with OpenCL')
     parser.add_argument('--width', type=int, default=800, help='Window width (default: 800)')
     parser.add_argument('--height', type=int, default=600, help='Window height (default: 600)')
     parser.add_argument('--fullscreen', action='store_true', help='Start in fullscreen mode')
     parser.add_argument('--auto-resolution', action='store_true', help='Use native screen resolution')
     parser.add_argument('--resolution', type=str, help='Set specific resolution (e.g., 1920x1080)')
-    return parser.parse_args()
+    return parser
+
+def parse_arguments(argv=None):
+    """Parse command line arguments"""
+    return create_parser().parse_args(argv)
 
 def main():
     """Main application entry point"""
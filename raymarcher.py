@@ -2,90 +2,151 @@ import pyopencl as cl
 import numpy as np
 import time
 import os
+import math
 from typing import Tuple, Optional
 
+# Movement direction -> (position axis, sign)
+MOVE_DIRECTIONS = {
+    'forward': (2, -1.0),
+    'backward': (2, 1.0),
+    'left': (0, -1.0),
+    'right': (0, 1.0),
+    'up': (1, 1.0),
+    'down': (1, -1.0),
+}
+
+def _camera_rotation(pitch: float, yaw: float, roll: float) -> Tuple[float, ...]:
+    """Compute the combined rotation matrix as nine row-major scalars"""
+    # Plain math on Python floats avoids NumPy dispatch on tiny arrays
+    cos_p, sin_p = math.cos(pitch), math.sin(pitch)
+    cos_y, sin_y = math.cos(yaw), math.sin(yaw)
+    cos_r, sin_r = math.cos(roll), math.sin(roll)
+    
+    # Combined rotation matrix (simplified for OpenCL)
+    return (
+        cos_y * cos_r, -cos_y * sin_r, sin_y,
+        sin_p * sin_y * cos_r + cos_p * sin_r,
+        -sin_p * sin_y * sin_r + cos_p * cos_r,
+        -sin_p * cos_y,
+        -cos_p * sin_y * cos_r + sin_p * sin_r,
+        cos_p * sin_y * sin_r + sin_p * cos_r,
+        cos_p * cos_y,
+    )
+
+def _wrap_pi(angle: float) -> float:
+    """Wrap an angle into [-pi, pi] in constant time"""
+    return math.remainder(angle, 2.0 * math.pi)
+
 class RayMarcher:
+    # OpenCL context shared by all instances, so built programs can be reused
+    _context = None
+    # Programs built on the shared context, keyed by kernel path
+    _program_cache = {}
+    
     def __init__(self, width: int = 800, height: int = 600):
         self.width = width
         self.height = height
         
         # Initialize OpenCL
-        self.context = cl.create_some_context(interactive=False)
+        self.context = self._get_context()
         self.queue = cl.CommandQueue(self.context)
         
         # Load and compile kernel
         self._load_kernel()
         
-        # Create output buffer
-        self.output_buffer = cl.Buffer(self.context, cl.mem_flags.WRITE_ONLY, 
-                                     width * height * 4)  # RGBA
+        # Create output buffer and bind the size-dependent kernel arguments
+        self.output_buffer = self._create_output_buffer(width, height)
+        self._bind_target_args()
         
-        # Camera parameters
-        self.camera_pos = np.array([0.0, 0.0, 5.0], dtype=np.float32)
+        # Camera parameters (position kept padded to float4 to match the
+        # OpenCL float3 argument layout; camera_pos is a view of it)
+        self._camera_pos4 = np.array([0.0, 0.0, 5.0, 0.0], dtype=np.float32)
+        self.camera_pos = self._camera_pos4[:3]
         self.camera_angles = np.array([0.0, 0.0, 0.0], dtype=np.float32)  # pitch, yaw, roll
         
+        # Camera rotation rows, each padded to float4 for the kernel and
+        # rewritten in place when the angle setters mark them dirty
+        self._camera_matrix = np.zeros((3, 4), dtype=np.float32)
+        self._matrix_dirty = True
+        
         # Animation parameters
         self.start_time = time.time()
         
         # Output array
         self.output_array = np.zeros((height, width, 4), dtype=np.uint8)
         
+    @classmethod
+    def _get_context(cls) -> cl.Context:
+        """Return the shared OpenCL context, creating it on first use"""
+        if cls._context is None:
+            cls._context = cl.create_some_context(interactive=False)
+        return cls._context
+    
+    def _create_output_buffer(self, width: int, height: int) -> cl.Buffer:
+        """Create the RGBA output buffer in host-accessible (pinned) memory"""
+        mf = cl.mem_flags
+        return cl.Buffer(self.context, mf.WRITE_ONLY | mf.ALLOC_HOST_PTR,
+                         width * height * 4)  # RGBA
+    
+    def _bind_target_args(self):
+        """Bind the kernel arguments that only change with the render target"""
+        self.kernel.set_arg(0, self.output_buffer)
+        self.kernel.set_arg(1, np.int32(self.width))
+        self.kernel.set_arg(2, np.int32(self.height))
+        self._global_size = (self.width, self.height)
+    
     def _load_kernel(self):
-        """Load and compile the OpenCL kernel"""
+        """Load and compile the OpenCL kernel, reusing a cached program if available"""
         kernel_path = os.path.join(os.path.dirname(__file__), 'shaders', 'raymarch.cl')
         
         try:
-            with open(kernel_path, 'r') as f:
-                kernel_source = f.read()
+            program = RayMarcher._program_cache.get(kernel_path)
+            if program is None:
+                with open(kernel_path, 'r') as f:
+                    kernel_source = f.read()
+                
+                program = cl.Program(self.context, kernel_source).build()
+                RayMarcher._program_cache[kernel_path] = program
             
-            self.program = cl.Program(self.context, kernel_source).build()
+            self.program = program
             self.kernel = self.program.raymarch_kernel
             
         except Exception as e:
             print(f"Error loading kernel: {e}")
             raise
     
-    def _create_camera_matrix(self) -> np.ndarray:
-        """Create camera rotation matrix from angles"""
-        pitch, yaw, roll = self.camera_angles
-        
-        # Rotation matrices
-        cos_p, sin_p = np.cos(pitch), np.sin(pitch)
-        cos_y, sin_y = np.cos(yaw), np.sin(yaw)
-        cos_r, sin_r = np.cos(roll), np.sin(roll)
-        
-        # Combined rotation matrix (simplified for OpenCL)
-        matrix = np.array([
-            cos_y * cos_r, -cos_y * sin_r, sin_y, 0,
-            sin_p * sin_y * cos_r + cos_p * sin_r, 
-            -sin_p * sin_y * sin_r + cos_p * cos_r, 
-            -sin_p * cos_y, 0,
-            -cos_p * sin_y * cos_r + sin_p * sin_r,
-            cos_p * sin_y * sin_r + sin_p * cos_r,
-            cos_p * cos_y, 0,
-            0, 0, 0, 1
-        ], dtype=np.float32)
-        
-        return matrix
+    def _update_camera_matrix(self):
+        """Write the camera rotation matrix into the preallocated buffer"""
+        pitch, yaw, roll = (float(a) for a in self.camera_angles)
+        r = _camera_rotation(pitch, yaw, roll)
+        
+        matrix = self._camera_matrix
+        matrix[0, :3] = r[0:3]
+        matrix[1, :3] = r[3:6]
+        matrix[2, :3] = r[6:9]
+    
+    def _get_camera_matrix(self) -> np.ndarray:
+        """Get the camera rotation rows, rebuilding them only when the angles changed"""
+        if self._matrix_dirty:
+            self._update_camera_matrix()
+            self._matrix_dirty = False
+        return self._camera_matrix
     
     def render(self) -> np.ndarray:
         """Render a frame and return RGBA array"""
         current_time = time.time() - self.start_time
-        camera_matrix = self._create_camera_matrix()
+        camera_matrix = self._get_camera_matrix()
         
-        # Set kernel arguments
-        self.kernel.set_args(
-            self.output_buffer,
-            np.int32(self.width),
-            np.int32(self.height),
-            np.float32(current_time),
-            camera_matrix,
-            self.camera_pos
-        )
+        # Set per-frame kernel arguments (output/size are bound on resize)
+        kernel = self.kernel
+        kernel.set_arg(3, np.float32(current_time))
+        kernel.set_arg(4, camera_matrix[0])
+        kernel.set_arg(5, camera_matrix[1])
+        kernel.set_arg(6, camera_matrix[2])
+        kernel.set_arg(7, self._camera_pos4)
         
         # Execute kernel
-        global_size = (self.width, self.height)
-        cl.enqueue_nd_range_kernel(self.queue, self.kernel, global_size, None)
+        cl.enqueue_nd_range_kernel(self.queue, kernel, self._global_size, None)
         
         # Read result
         cl.enqueue_copy(self.queue, self.output_array, self.output_buffer)
@@ -95,35 +156,44 @@ class RayMarcher:
     
     def move_camera(self, direction: str, speed: float = 0.1):
         """Move camera in specified direction"""
-        if direction == 'forward':
-            self.camera_pos[2] -= speed
-        elif direction == 'backward':
-            self.camera_pos[2] += speed
-        elif direction == 'left':
-            self.camera_pos[0] -= speed
-        elif direction == 'right':
-            self.camera_pos[0] += speed
-        elif direction == 'up':
-            self.camera_pos[1] += speed
-        elif direction == 'down':
-            self.camera_pos[1] -= speed
+        move = MOVE_DIRECTIONS.get(direction)
+        if move is not None:
+            axis, sign = move
+            self.camera_pos[axis] += sign * speed
+    
+    def translate_camera(self, dx: float = 0.0, dy: float = 0.0, dz: float = 0.0):
+        """Move camera by a world-space offset"""
+        pos = self.camera_pos
+        pos[0] += dx
+        pos[1] += dy
+        pos[2] += dz
     
     def rotate_camera(self, pitch: float = 0.0, yaw: float = 0.0, roll: float = 0.0):
         """Rotate camera by specified angles"""
-        self.camera_angles[0] += pitch
-        self.camera_angles[1] += yaw
-        self.camera_angles[2] += roll
+        cur_pitch, cur_yaw, cur_roll = (float(a) for a in self.camera_angles)
         
-        # Clamp pitch to avoid gimbal lock
-        self.camera_angles[0] = np.clip(self.camera_angles[0], -np.pi/2, np.pi/2)
+        # Clamp pitch to avoid gimbal lock; keep yaw and roll wrapped
+        self.camera_angles[:] = (
+            max(-math.pi/2, min(cur_pitch + pitch, math.pi/2)),
+            _wrap_pi(cur_yaw + yaw),
+            _wrap_pi(cur_roll + roll)
+        )
+        self._matrix_dirty = True
     
     def set_camera_position(self, x: float, y: float, z: float):
         """Set absolute camera position"""
-        self.camera_pos = np.array([x, y, z], dtype=np.float32)
+        self.camera_pos[:] = (x, y, z)
     
     def set_camera_angles(self, pitch: float, yaw: float, roll: float = 0.0):
         """Set absolute camera angles"""
-        self.camera_angles = np.array([pitch, yaw, roll], dtype=np.float32)
+        self.camera_angles[:] = (pitch, yaw, roll)
+        self._matrix_dirty = True
+    
+    def reset_camera(self):
+        """Reset camera to its initial position and orientation"""
+        self.camera_pos[:] = (0.0, 0.0, 5.0)
+        self.camera_angles.fill(0.0)
+        self._matrix_dirty = True
     
     def get_camera_info(self) -> dict:
         """Get current camera information"""
@@ -140,8 +210,8 @@ class RayMarcher:
             self.height = height
             
             # Recreate output buffer
-            self.output_buffer = cl.Buffer(self.context, cl.mem_flags.WRITE_ONLY, 
-                                         width * height * 4)
+            self.output_buffer = self._create_output_buffer(width, height)
+            self._bind_target_args()
             self.output_array = np.zeros((height, width, 4), dtype=np.uint8)
     
     def cleanup(self):
@@ -2,6 +2,6 @@
 Scene definitions for the raymarcher
 """
 
-from .scenes import Scene, get_scene, SCENES
+from .scenes import Scene, SceneObject, get_scene, SCENES, OBJECT_TYPES, ANIMATION_TYPES
 
-__all__ = ['Scene', 'get_scene', 'SCENES']
+__all__ = ['Scene', 'SceneObject', 'get_scene', 'SCENES', 'OBJECT_TYPES', 'ANIMATION_TYPES']
@@ -1,31 +1,256 @@
 # Scene definitions for the raymarcher
 # Each scene defines objects and their properties
 
+from functools import lru_cache
+
 import numpy as np
 
+# Type lookup tables: object and animation types are stored as small ints
+OBJECT_TYPES = ('sphere', 'box', 'torus')
+ANIMATION_TYPES = ('none', 'orbit', 'rotate', 'bob')
+OBJECT_TYPE_IDS = {name: i for i, name in enumerate(OBJECT_TYPES)}
+ANIMATION_TYPE_IDS = {name: i for i, name in enumerate(ANIMATION_TYPES)}
+
+# Per-object SoA columns: name -> (per-object shape, dtype)
+# shape_params holds (radius, 0, 0) for spheres, the size for boxes
+# and (major_radius, minor_radius, 0) for tori
+OBJECT_COLUMNS = {
+    'positions': ((3,), np.float32),
+    'type_ids': ((), np.int32),
+    'shape_params': ((3,), np.float32),
+    'animated': ((), np.bool_),
+    'animation_type_ids': ((), np.int32),
+    'phases': ((), np.float32),
+    'properties': ((), object),  # The properties dict as given (e.g. material parameters)
+}
+
+# Per-light SoA columns, one float4 per light: xyz position (w unused) and
+# rgb color with the intensity packed into w
+LIGHT_COLUMNS = {
+    'light_positions': ((4,), np.float32),
+    'light_colors': ((4,), np.float32),
+}
+
+def _empty_columns(layout: dict) -> dict:
+    """Allocate zero-length arrays for a column layout"""
+    return {name: np.empty((0,) + shape, dtype=dtype) for name, (shape, dtype) in layout.items()}
+
+def _reserve_columns(columns: dict, count: int, extra: int):
+    """Grow every column geometrically so `extra` more rows fit after `count`"""
+    needed = count + extra
+    capacity = len(next(iter(columns.values())))
+    if needed <= capacity:
+        return
+    
+    new_capacity = max(needed, capacity * 2, 8)
+    for name, column in columns.items():
+        grown = np.zeros((new_capacity,) + column.shape[1:], dtype=column.dtype)
+        grown[:count] = column[:count]
+        columns[name] = grown
+
+def _type_ids(obj_type: str, properties: dict) -> tuple:
+    """Look up the (object type id, animation type id) pair for an object"""
+    if obj_type not in OBJECT_TYPE_IDS:
+        raise ValueError(f"Unknown object type: {obj_type}")
+    
+    animation_type = properties.get('animation_type', 'none')
+    if animation_type not in ANIMATION_TYPE_IDS:
+        raise ValueError(f"Unknown animation type: {animation_type}")
+    
+    return OBJECT_TYPE_IDS[obj_type], ANIMATION_TYPE_IDS[animation_type]
+
+def _shape_params(obj_type: str, properties: dict) -> tuple:
+    """Pack type-specific size properties into a 3-float tuple"""
+    if obj_type == 'sphere':
+        return (properties.get('radius', 1.0), 0.0, 0.0)
+    if obj_type == 'box':
+        return tuple(properties.get('size', (1.0, 1.0, 1.0)))
+    return (properties.get('major_radius', 1.0), properties.get('minor_radius', 0.25), 0.0)
+
+def _morton_order(positions: np.ndarray) -> np.ndarray:
+    """Permutation that sorts positions along a 3D Morton (Z-order) curve"""
+    lo = positions.min(axis=0)
+    extent = np.maximum(positions.max(axis=0) - lo, 1e-6)
+    q = ((positions - lo) / extent * 1023.0).astype(np.uint32)
+    
+    # Spread the 10 bits of each quantized coordinate two bits apart
+    q = (q | (q << 16)) & 0x030000FF
+    q = (q | (q << 8)) & 0x0300F00F
+    q = (q | (q << 4)) & 0x030C30C3
+    q = (q | (q << 2)) & 0x09249249
+    codes = q[:, 0] | (q[:, 1] << 1) | (q[:, 2] << 2)
+    return np.argsort(codes, kind='stable')
+
+class SceneObject:
+    """View of one scene object; position and shape_params alias the scene arrays"""
+    __slots__ = ('type_id', 'position', 'shape_params', 'animated', 'animation_type_id', 'phase',
+                 'properties')
+    
+    def __init__(self, type_id: int, position: np.ndarray, shape_params: np.ndarray,
+                 animated: bool, animation_type_id: int, phase: float, properties: dict):
+        self.type_id = type_id
+        self.position = position
+        self.shape_params = shape_params
+        self.animated = animated
+        self.animation_type_id = animation_type_id
+        self.phase = phase
+        self.properties = properties
+    
+    @property
+    def type(self) -> str:
+        return OBJECT_TYPES[self.type_id]
+    
+    @property
+    def animation_type(self) -> str:
+        return ANIMATION_TYPES[self.animation_type_id]
+    
+    def __repr__(self) -> str:
+        return (f"SceneObject(type={self.type!r}, position={self.position.tolist()}, "
+                f"shape_params={self.shape_params.tolist()}, animated={self.animated}, "
+                f"animation_type={self.animation_type!r}, phase={self.phase}, "
+                f"properties={self.properties!r})")
+
 class Scene:
     def __init__(self, name: str = "Default Scene"):
         self.name = name
-        self.objects = []
-        self.lights = []
         self.camera_start_pos = np.array([0.0, 0.0, 5.0], dtype=np.float32)
         self.camera_start_angles = np.array([0.0, 0.0, 0.0], dtype=np.float32)
+        
+        # Object and light data as parallel arrays, grown geometrically like a list
+        self._count = 0
+        self._columns = _empty_columns(OBJECT_COLUMNS)
+        self._light_count = 0
+        self._light_columns = _empty_columns(LIGHT_COLUMNS)
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __getitem__(self, index: int) -> 'SceneObject':
+        """Return a lightweight view of a single object"""
+        if not -self._count <= index < self._count:
+            raise IndexError("scene object index out of range")
+        index %= self._count
+        
+        return SceneObject(
+            int(self.type_ids[index]),
+            self.positions[index],
+            self.shape_params[index],
+            bool(self.animated[index]),
+            int(self.animation_type_ids[index]),
+            float(self.phases[index]),
+            self._columns['properties'][index]
+        )
+    
+    @property
+    def objects(self) -> list:
+        """Per-object views (built on demand)"""
+        return [self[i] for i in range(self._count)]
+    
+    @property
+    def positions(self) -> np.ndarray:
+        return self._columns['positions'][:self._count]
+    
+    @property
+    def type_ids(self) -> np.ndarray:
+        return self._columns['type_ids'][:self._count]
+    
+    @property
+    def shape_params(self) -> np.ndarray:
+        return self._columns['shape_params'][:self._count]
+    
+    @property
+    def animated(self) -> np.ndarray:
+        return self._columns['animated'][:self._count]
+    
+    @property
+    def animation_type_ids(self) -> np.ndarray:
+        return self._columns['animation_type_ids'][:self._count]
+    
+    @property
+    def phases(self) -> np.ndarray:
+        return self._columns['phases'][:self._count]
+    
+    @property
+    def light_positions(self) -> np.ndarray:
+        return self._light_columns['light_positions'][:self._light_count]
+    
+    @property
+    def light_colors(self) -> np.ndarray:
+        return self._light_columns['light_colors'][:self._light_count]
+    
+    def _reserve(self, extra: int):
+        """Ensure capacity for `extra` more objects"""
+        _reserve_columns(self._columns, self._count, extra)
     
     def add_object(self, obj_type: str, position: tuple, properties: dict):
         """Add an object to the scene"""
-        self.objects.append({
-            'type': obj_type,
-            'position': np.array(position, dtype=np.float32),
-            'properties': properties
-        })
+        type_id, animation_type_id = _type_ids(obj_type, properties)
+        
+        self._reserve(1)
+        i = self._count
+        columns = self._columns
+        columns['positions'][i] = position
+        columns['type_ids'][i] = type_id
+        columns['shape_params'][i] = _shape_params(obj_type, properties)
+        columns['animated'][i] = properties.get('animated', False)
+        columns['animation_type_ids'][i] = animation_type_id
+        columns['phases'][i] = properties.get('phase', 0.0)
+        columns['properties'][i] = properties
+        self._count += 1
+    
+    def add_objects_bulk(self, obj_type: str, positions: np.ndarray, properties: dict,
+                         phases: np.ndarray = None):
+        """Add an (N, 3) array of same-type objects, with optional per-object phases"""
+        type_id, animation_type_id = _type_ids(obj_type, properties)
+        
+        positions = np.asarray(positions, dtype=np.float32).reshape(-1, 3)
+        n = len(positions)
+        self._reserve(n)
+        block = slice(self._count, self._count + n)
+        columns = self._columns
+        columns['positions'][block] = positions
+        columns['type_ids'][block] = type_id
+        columns['shape_params'][block] = _shape_params(obj_type, properties)
+        columns['animated'][block] = properties.get('animated', False)
+        columns['animation_type_ids'][block] = animation_type_id
+        if phases is None:
+            columns['phases'][block] = properties.get('phase', 0.0)
+            columns['properties'][block] = [dict(properties) for _ in range(n)]
+        else:
+            columns['phases'][block] = phases
+            columns['properties'][block] = [dict(properties, phase=float(p))
+                                            for p in columns['phases'][block]]
+        self._count += n
     
     def add_light(self, position: tuple, color: tuple = (1.0, 1.0, 1.0), intensity: float = 1.0):
         """Add a light to the scene"""
-        self.lights.append({
-            'position': np.array(position, dtype=np.float32),
-            'color': np.array(color, dtype=np.float32),
-            'intensity': intensity
-        })
+        _reserve_columns(self._light_columns, self._light_count, 1)
+        i = self._light_count
+        self._light_columns['light_positions'][i, :3] = position
+        self._light_columns['light_colors'][i] = (*color, intensity)
+        self._light_count += 1
+    
+    def finalize(self) -> 'Scene':
+        """Sort objects along a Morton curve and trim all columns to contiguous, exact-size arrays"""
+        order = _morton_order(self.positions) if self._count > 1 else slice(None)
+        for name, column in self._columns.items():
+            self._columns[name] = np.ascontiguousarray(column[:self._count][order])
+        for name, column in self._light_columns.items():
+            self._light_columns[name] = np.ascontiguousarray(column[:self._light_count])
+        return self
+    
+    def clone(self) -> 'Scene':
+        """Return an independent copy of this scene"""
+        new = Scene(self.name)
+        new.camera_start_pos = self.camera_start_pos.copy()
+        new.camera_start_angles = self.camera_start_angles.copy()
+        new._count = self._count
+        new._columns = {name: column.copy() for name, column in self._columns.items()}
+        properties = new._columns['properties']
+        properties[:self._count] = [dict(p) for p in properties[:self._count]]
+        new._light_count = self._light_count
+        new._light_columns = {name: column.copy() for name, column in self._light_columns.items()}
+        return new
 
 # Default demo scene
 def create_demo_scene() -> Scene:
@@ -89,16 +314,16 @@ def create_complex_scene() -> Scene:
     """Create a more complex scene"""
     scene = Scene("Complex Scene")
     
-    # Multiple spheres in a pattern
-    for i in range(-2, 3):
-        for j in range(-2, 3):
-            if (i + j) % 2 == 0:
-                scene.add_object('sphere', (i * 2.0, 0.0, j * 2.0), {
-                    'radius': 0.5,
-                    'animated': True,
-                    'animation_type': 'bob',
-                    'phase': (i + j) * 0.5
-                })
+    # Multiple spheres in a checkerboard pattern
+    ii, jj = np.mgrid[-2:3, -2:3]
+    mask = (ii + jj) % 2 == 0
+    i, j = ii[mask], jj[mask]
+    positions = np.stack([i * 2.0, np.zeros(len(i)), j * 2.0], axis=1)
+    scene.add_objects_bulk('sphere', positions, {
+        'radius': 0.5,
+        'animated': True,
+        'animation_type': 'bob'
+    }, phases=(i + j) * 0.5)
     
     # Central torus
     scene.add_object('torus', (0.0, 2.0, 0.0), {
@@ -130,10 +355,14 @@ SCENES = {
     'complex': create_complex_scene
 }
 
+@lru_cache(maxsize=None)
+def _scene_template(name: str) -> Scene:
+    """Build a scene once; callers receive clones of it"""
+    return SCENES[name]().finalize()
+
 def get_scene(name: str = 'demo') -> Scene:
     """Get a scene by name"""
-    if name in SCENES:
-        return SCENES[name]()
-    else:
+    if name not in SCENES:
         print(f"Scene '{name}' not found, using demo scene")
-        return create_demo_scene()
+        name = 'demo'
+    return _scene_template(name).clone()
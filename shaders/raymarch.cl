@@ -23,14 +23,20 @@ float map(float3 pos, float time) {
     float3 box_pos = pos - (float3)(0.0f, -2.0f, 0.0f);
     float box = sdBox(box_pos, (float3)(2.0f, 0.1f, 2.0f));
     
-    // Rotating torus
+    float d = fmin(sphere, box);
+    
+    // Rotating torus. Its bounding sphere (radius major + minor) never
+    // overestimates the distance, so skip the exact SDF and rotation
+    // whenever the bound is already farther than the nearest surface.
     float3 torus_pos = pos - (float3)(0.0f, 1.0f, 3.0f);
-    float c = cos(time);
-    float s = sin(time);
-    torus_pos.xz = (float2)(c * torus_pos.x - s * torus_pos.z, s * torus_pos.x + c * torus_pos.z);
-    float torus = sdTorus(torus_pos, (float2)(1.0f, 0.3f));
+    if (length(torus_pos) - 1.3f < d) {
+        float c = cos(time);
+        float s = sin(time);
+        torus_pos.xz = (float2)(c * torus_pos.x - s * torus_pos.z, s * torus_pos.x + c * torus_pos.z);
+        d = fmin(d, sdTorus(torus_pos, (float2)(1.0f, 0.3f)));
+    }
     
-    return fmin(fmin(sphere, box), torus);
+    return d;
 }
 
 // Calculate normal using finite differences
@@ -77,7 +83,9 @@ __kernel void raymarch_kernel(__global uchar4* output,
                              const int width,
                              const int height,
                              const float time,
-                             const float16 camera_matrix,
+                             const float4 camera_row0,
+                             const float4 camera_row1,
+                             const float4 camera_row2,
                              const float3 camera_pos) {
     
     int x = get_global_id(0);
@@ -93,12 +101,11 @@ __kernel void raymarch_kernel(__global uchar4* output,
     // Ray direction
     float3 rd = normalize((float3)(uv.x, uv.y, -1.0f));
     
-    // Apply camera rotation (simplified - using first 3x3 of matrix)
-    float3 rd_rotated;
-    rd_rotated.x = rd.x * camera_matrix.s0 + rd.y * camera_matrix.s1 + rd.z * camera_matrix.s2;
-    rd_rotated.y = rd.x * camera_matrix.s4 + rd.y * camera_matrix.s5 + rd.z * camera_matrix.s6;
-    rd_rotated.z = rd.x * camera_matrix.s8 + rd.y * camera_matrix.s9 + rd.z * camera_matrix.sa;
-    rd = normalize(rd_rotated);
+    // Apply camera rotation (rows of the 3x3 matrix, padded to float4).
+    // The matrix is orthonormal, so the rotated ray is already unit length.
+    rd = (float3)(dot(rd, camera_row0.xyz),
+                  dot(rd, camera_row1.xyz),
+                  dot(rd, camera_row2.xyz));
     
     // Raymarch
     float d = raymarch(camera_pos, rd, time);